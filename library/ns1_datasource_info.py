@@ -41,6 +41,23 @@ options:
       - Whether to ignore SSL errors. Defaults to false
     type: bool
     required: false
+  rate_limit_strategy:
+    description:
+      - How the NS1 client should react as the API rate limit is
+        approached. Use C(solo) to have calls slow down and retry rather
+        than fail when the limit is hit, or C(concurrent) when several
+        workers share the same key (requires I(parallelism)).
+    type: str
+    required: false
+    choices:
+      - solo
+      - concurrent
+  parallelism:
+    description:
+      - Number of workers sharing the API key. Required when
+        I(rate_limit_strategy) is C(concurrent).
+    type: int
+    required: false
 '''
 
 EXAMPLES = '''
@@ -75,17 +92,14 @@ class NS1DataSources(NS1ModuleBase):
         )
 
     def get_datasources(self):
-        to_return = {}
         try:
             raw_response = self.ns1.datasource().list()
         except ResourceException as re:
             self.module.fail_json(
                 msg="error code %s - %s " % (re.response.code, re.message)
             )
-        else:
-            to_return = {x["name"]: x for x in raw_response}
-
-        return to_return
+            raw_response = []
+        return {x["name"]: x for x in raw_response}
 
     def exec_module(self):
         datasources = self.get_datasources()
@@ -94,8 +108,7 @@ class NS1DataSources(NS1ModuleBase):
 
 def main():
     ds = NS1DataSources()
-    result = ds.exec_module()
-    ds.module.exit_json(**result)
+    ds.exec_module()
 
 
 if __name__ == '__main__':
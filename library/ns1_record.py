@@ -42,6 +42,23 @@ options:
       - Whether to ignore SSL errors. Defaults to false
     type: bool
     required: false
+  rate_limit_strategy:
+    description:
+      - How the NS1 client should react as the API rate limit is
+        approached. Use C(solo) to have calls slow down and retry rather
+        than fail when the limit is hit, or C(concurrent) when several
+        workers share the same key (requires I(parallelism)).
+    type: str
+    required: false
+    choices:
+      - solo
+      - concurrent
+  parallelism:
+    description:
+      - Number of workers sharing the API key. Required when
+        I(rate_limit_strategy) is C(concurrent).
+    type: int
+    required: false
   state:
     description:
       - Whether the record should be present or not.  Use C(present) to create
@@ -268,9 +285,7 @@ EXAMPLES = '''
 RETURN = '''
 '''
 
-import copy  # noqa
-from ruamel.yaml import YAML
-from io import StringIO
+import json
 
 try:
     from ansible.module_utils.ns1 import NS1ModuleBase
@@ -294,6 +309,15 @@ RECORD_KEYS_MAP = dict(
     regions=dict(appendable=False),
 )
 
+# record keys passed through to the API by api_params; answers is handled
+# separately in the create path
+API_PARAM_KEYS = tuple(key for key in RECORD_KEYS_MAP if key != "answers")
+
+# record keys whose list values can be merged in append mode
+APPENDABLE_KEYS = frozenset(
+    key for key, opts in RECORD_KEYS_MAP.items() if opts['appendable']
+)
+
 RECORD_TYPES = [
     'A',
     'AAAA',
@@ -363,6 +387,9 @@ class NS1Record(NS1ModuleBase):
         NS1ModuleBase.__init__(self,
                                self.module_arg_spec,
                                supports_check_mode=True)
+        # cache for filter_empty_subparams; params don't change within a
+        # run and update() filters every key in RECORD_KEYS_MAP
+        self._filtered_params = {}
 
     def filter_empty_subparams(self, param_name):
         """Used to remove any possible empty module params passed in from a
@@ -374,20 +401,22 @@ class NS1Record(NS1ModuleBase):
         :return: Paramaters that are not empty.
         :rtype: list
         """
+        if param_name in self._filtered_params:
+            return self._filtered_params[param_name]
         param = self.module.params.get(param_name)
-        filtered = []
         if isinstance(param, list):
-            for subparam in param:
-                if isinstance(subparam, dict):
-                    filtered.append(
-                        dict(
-                            (key, value)
-                            for key, value in subparam.items()
-                            if value is not None
-                        )
-                    )
+            filtered = [
+                dict(
+                    (key, value)
+                    for key, value in subparam.items()
+                    if value is not None
+                )
+                for subparam in param
+                if isinstance(subparam, dict)
+            ]
         else:
             filtered = param
+        self._filtered_params[param_name] = filtered
         return filtered
 
     def api_params(self):
@@ -398,12 +427,12 @@ class NS1Record(NS1ModuleBase):
                  required by the API.
         :rtype: dict
         """
-        params = dict(
-            (key, self.module.params.get(key))
-            for key, value in RECORD_KEYS_MAP.items()
-            if key != "answers" and self.module.params.get(key) is not None
+        params = self.module.params
+        return dict(
+            (key, params[key])
+            for key in API_PARAM_KEYS
+            if params.get(key) is not None
         )
-        return params
 
     def sanitize_record(self, record):
         """Remove fields from the API-returned record that we don't want to
@@ -415,16 +444,19 @@ class NS1Record(NS1ModuleBase):
         :rtype: list | dict | any
         """
         def remove_ids(d):
-            if isinstance(d, dict):
-                if 'id' in d:
-                    del d['id']
-                for key, val in d.items():
-                    if isinstance(val, (dict, list)):
-                        remove_ids(val)
-            if isinstance(d, list):
-                for i in d:
-                    if isinstance(i, (dict, list)):
-                        remove_ids(i)
+            # iterative walk; avoids a Python call frame per nested
+            # dict/list on large records
+            stack = [d]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    node.pop('id', None)
+                    values = node.values()
+                else:
+                    values = node
+                stack.extend(
+                    val for val in values if isinstance(val, (dict, list))
+                )
             return d
 
         record = remove_ids(record)
@@ -484,8 +516,12 @@ class NS1Record(NS1ModuleBase):
         :param record: JSON record information from the API.
         :type record: Obj
         """
-        # clean copy of record to preserve IDs for response if no update required
-        record_data = self.sanitize_record(copy.deepcopy(record.data))
+        # clean copy of record to preserve IDs for response if no update
+        # required; a JSON round-trip clones the API's JSON-shaped data
+        # far cheaper than copy.deepcopy
+        record_data = self.sanitize_record(
+            json.loads(json.dumps(record.data))
+        )
         changed = False
         args = {}
 
@@ -494,15 +530,22 @@ class NS1Record(NS1ModuleBase):
 
             if input_data is not None:
                 if (
-                    RECORD_KEYS_MAP[key]['appendable']
+                    key in APPENDABLE_KEYS
                     and self.module.params.get('record_mode') == 'append'
                 ):
                     # create union of input and existing record data,
-                    # preserving existing order
+                    # preserving existing order; membership is checked
+                    # against canonical JSON keys since the answer and
+                    # filter dicts themselves are not hashable
+                    existing = set(
+                        json.dumps(obj, sort_keys=True)
+                        for obj in record_data[key]
+                    )
                     input_data = record_data[key] + [
                         input_obj
                         for input_obj in input_data
-                        if input_obj not in record_data[key]
+                        if json.dumps(input_obj, sort_keys=True)
+                        not in existing
                     ]
 
                 if input_data != record_data[key]:
@@ -510,8 +553,10 @@ class NS1Record(NS1ModuleBase):
                     args[key] = input_data
 
         # create a new copy of the previously sanitized dict that will be
-        # updated with changing args to support --diff
-        after_changes = copy.deepcopy(record_data)
+        # updated with changing args to support --diff; a shallow copy is
+        # enough since changed keys are replaced wholesale and unchanged
+        # values are only read
+        after_changes = dict(record_data)
         for k, v in args.items():
             if after_changes[k] != v:
                 after_changes[k] = v
@@ -548,18 +593,24 @@ class NS1Record(NS1ModuleBase):
                         mark the task accordingly.
         :type : Bool
         """
-        # convert dictionaries to yaml txt dump
-        yaml=YAML(typ='safe')
-        yaml.default_flow_style = False
-        with StringIO() as before_stream:
-            yaml.dump(before, stream=before_stream)
-            before_yaml = before_stream.getvalue()
-        with StringIO() as after_stream:
-            yaml.dump(after, stream=after_stream)
-            after_yaml = after_stream.getvalue()
-
         # build the final dict to pass into exit_json
         if self.module._diff:
+            # ruamel.yaml is heavyweight and only needed to render the
+            # --diff output, so import it here rather than making every
+            # module invocation pay the import cost
+            from io import StringIO
+            from ruamel.yaml import YAML
+
+            # convert dictionaries to yaml txt dump
+            yaml = YAML(typ='safe')
+            yaml.default_flow_style = False
+            with StringIO() as before_stream:
+                yaml.dump(before, stream=before_stream)
+                before_yaml = before_stream.getvalue()
+            with StringIO() as after_stream:
+                yaml.dump(after, stream=after_stream)
+                after_yaml = after_stream.getvalue()
+
             exec_result = dict(
                 diff={'before': {}, 'after': {}})
             if after is not None:
@@ -37,9 +37,9 @@ options:
     required: true
   algorithm:
     description:
-      - The algorithm used in tsig
+      - The algorithm used in tsig. Required when C(state) is C(present).
     type: str
-    required: true
+    required: false
     choices:
       - hmac-sha1
       - hmac-sha224
@@ -49,9 +49,10 @@ options:
       - hmac-md5
   secret:
     description:
-      - the secret used in tsig must be in base64
+      - the secret used in tsig must be in base64. Required when
+        C(state) is C(present).
     type: str
-    required: true
+    required: false
   state:
     description:
       - Whether the tsig should be present or not.  Use C(present) to create
@@ -63,7 +64,7 @@ options:
       
 requirements:
   - python >= 2.7
-  - ns1-python >= 0.9.19
+  - ns1-python >= 0.17.1
 
 seealso:
   - name: Documentation for NS1 API
@@ -103,7 +104,7 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-import functools  # noqa
+import binascii
 
 try:
     from ansible.module_utils.ns1 import NS1ModuleBase, HAS_NS1, Decorators
@@ -117,18 +118,30 @@ except ImportError:
     # This is handled in NS1 module_utils
     pass
 
-# list of params that should be treated as set during diff
-SET_PARAMS = [
+# params that should be treated as set during diff
+SET_PARAMS = frozenset([
     "other_ips",
     "other_ports",
     "networks",
-]
+])
 
-# list of params that should be removed before calls to API
-SANITIZED_PARAMS = [
+# params that should be removed before calls to API
+SANITIZED_PARAMS = frozenset([
     "state",
     "name",
-]
+])
+
+MODULE_ARG_SPEC = {
+    "key_name": {"required": True, "type": "str"},
+    "algorithm": {"required": False, "type": "str", "default": None},
+    "secret": {"required": False, "type": "str", "default": None},
+    "state": {
+        "required": False,
+        "type": "str",
+        "default": "present",
+        "choices": ["present", "absent"],
+    },
+}
 
 
 class NS1Tsig(NS1ModuleBase):
@@ -138,21 +151,13 @@ class NS1Tsig(NS1ModuleBase):
     def __init__(self):
         """Constructor method
         """
-        self.module_arg_spec = dict(
-            key_name=dict(required=False, type='str', default="defaultName"),
-            algorithm=dict(required=False, type='str', default="defaultAlgo"),
-            secret=dict(required=False, type='str', default="defaultSecret"),
-            state=dict(
-                required=False,
-                type="str",
-                default="present",
-                choices=["present", "absent"],
-            )
+        NS1ModuleBase.__init__(
+            self,
+            MODULE_ARG_SPEC,
+            supports_check_mode=True,
+            required_if=[("state", "present", ["algorithm", "secret"])],
         )
-
-        NS1ModuleBase.__init__(self,
-                               self.module_arg_spec,
-                               supports_check_mode=True)
+        self.tsig_client = self.ns1.tsig()
 
     def sanitize_params(self, params):
         """Removes fields from Ansible module parameters that have no value
@@ -193,8 +198,7 @@ class NS1Tsig(NS1ModuleBase):
         tsig = None
         if name:
             try:
-                tsig_client = self.ns1.tsig()
-                tsig = tsig_client.retrieve(name)
+                tsig = self.tsig_client.retrieve(name)
             except ResourceException as re:
                 if re.response.code != 404:
                     self.module.fail_json(
@@ -225,7 +229,7 @@ class NS1Tsig(NS1ModuleBase):
                 if subparam_diff:
                     diff[param] = subparam_diff
             elif isinstance(wanted_val, list) and param in SET_PARAMS:
-                if set(have[param]) != set(wanted_val):
+                if set(have[param]).symmetric_difference(wanted_val):
                     diff[param] = wanted_val
             elif have[param] != wanted_val:
                 diff[param] = wanted_val
@@ -275,12 +279,21 @@ class NS1Tsig(NS1ModuleBase):
         elif len(want_secondaries) != len(have_secondaries):
             return True
 
+        # index existing secondaries once and compare wanted ones against
+        # it directly, bailing out on the first difference
         have = self.convert_secondaries_to_dict(have_secondaries)
-        want = self.convert_secondaries_to_dict(want_secondaries)
-        diff = self.diff_params(have, want)
-        if diff:
-            return True
-
+        try:
+            for want_secondary in want_secondaries:
+                key = (want_secondary["ip"], want_secondary["port"])
+                have_secondary = have.get(key)
+                if have_secondary is None:
+                    return True
+                if self.diff_params(have_secondary, want_secondary):
+                    return True
+        except KeyError as ke:
+            self.module.fail_json(
+                msg="missing field in secondary definition: {0}".format(ke)
+            )
         return False
 
     def convert_secondaries_to_dict(self, secondaries):
@@ -308,8 +321,9 @@ class NS1Tsig(NS1ModuleBase):
         :return: The updated tsig object returned by NS1
         :rtype: dict
         """
-        tsig_client = self.ns1.tsig()
-        return tsig_client.update(errback=self.errback_generator(), **args)
+        return self.tsig_client.update(
+            errback=self.errback_generator(), **args
+        )
 
     @Decorators.skip_in_check_mode
     def create(self, args):
@@ -320,22 +334,11 @@ class NS1Tsig(NS1ModuleBase):
         :return: [description]
         :rtype: [type]
         """
-        tsig_client = self.ns1.tsig()
-        return tsig_client.create(
+        return self.tsig_client.create(
             errback=self.errback_generator(),
             **args
         )
 
-    @Decorators.skip_in_check_mode
-    def delete(self, tsig):
-        """Deletes a tsig in NS1.
-
-        :param tsig: tsig object of existing tsig returned by NS1
-        :type tsig: dict
-        """
-        tsig_client = self.ns1.tsig()
-        tsig_client.delete(tsig["name"], errback=self.errback_generator())
-
     def exec_module(self):
         """Main execution method of module.  Creates, updates or deletes a
         tsig based on Ansible parameters.
@@ -346,13 +349,14 @@ class NS1Tsig(NS1ModuleBase):
 
         changed = False
         state = self.module.params.get("state")
-        tsig = self.get_tsig(self.module.params.get("key_name"))
 
+        if state == "absent":
+            changed = self.absent(self.module.params.get("key_name"))
+            return self.build_result(changed, {})
+
+        tsig = self.get_tsig(self.module.params.get("key_name"))
         if state == "present":
             changed, tsig = self.present(tsig)
-        if state == "absent":
-            changed = self.absent(tsig)
-            tsig = {}
         return self.build_result(changed, tsig)
 
     def present(self, tsig):
@@ -368,6 +372,13 @@ class NS1Tsig(NS1ModuleBase):
         :rtype: tuple(bool, dict)
         """
         want = self.sanitize_params(self.module.params)
+        if "secret" in want:
+            # reject malformed secrets locally rather than round-tripping
+            # them to the API
+            try:
+                binascii.a2b_base64(want["secret"])
+            except (binascii.Error, ValueError):
+                self.module.fail_json(msg="secret is not valid base64")
         if tsig:
             return self.update_on_change(tsig, want)
         return True, self.create(want)
@@ -388,20 +399,30 @@ class NS1Tsig(NS1ModuleBase):
             return True, self.update(changed_params)
         return False, tsig
 
-    def absent(self, tsig):
+    def absent(self, name):
         """Handles use case where desired state of tsig is absent.
-        If tsig is provided, it is deleted.
+        Deletes the tsig directly by name; a 404 from the API means it
+        was already absent, so no lookup is made first.
 
-        :param tsig: tsig object of existing tsig returned by NS1
-        :type tsig: dict, optional
+        :param name: Name of the tsig to delete
+        :type name: str
         :return: Whether or not a change occured
         :rtype: bool
         """
 
-        if tsig:
-            self.delete(tsig)
-            return True
-        return False
+        if self.module.check_mode:
+            # still need the lookup to report whether a real run would
+            # remove anything
+            return self.get_tsig(name) is not None
+        try:
+            self.tsig_client.delete(name)
+        except ResourceException as re:
+            if re.response.code == 404:
+                return False
+            self.module.fail_json(
+                msg="error code %s - %s " % (re.response.code, re.message)
+            )
+        return True
 
     def build_result(self, changed, tsig):
         """Builds dict of results from module execution to pass to module.exit_json()
@@ -41,6 +41,23 @@ options:
       - Whether to ignore SSL errors. Defaults to false
     type: bool
     required: false
+  rate_limit_strategy:
+    description:
+      - How the NS1 client should react as the API rate limit is
+        approached. Use C(solo) to have calls slow down and retry rather
+        than fail when the limit is hit, or C(concurrent) when several
+        workers share the same key (requires I(parallelism)).
+    type: str
+    required: false
+    choices:
+      - solo
+      - concurrent
+  parallelism:
+    description:
+      - Number of workers sharing the API key. Required when
+        I(rate_limit_strategy) is C(concurrent).
+    type: int
+    required: false
   state:
     description:
       - Whether the zone should be present or not.  Use C(present) to create
@@ -208,7 +225,7 @@ options:
 
 requirements:
   - python >= 2.7
-  - ns1-python >= 0.9.19
+  - ns1-python >= 0.17.1
 
 seealso:
   - name: Documentation for NS1 API
@@ -241,8 +258,6 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-import functools  # noqa
-
 try:
     from ansible.module_utils.ns1 import NS1ModuleBase, HAS_NS1, Decorators
 except ImportError:
@@ -255,21 +270,121 @@ except ImportError:
     # This is handled in NS1 module_utils
     pass
 
+from operator import itemgetter
+
+# key used to match up secondaries between have and want; raises the
+# same KeyError as subscripting when a field is missing, but from C
+_secondary_key = itemgetter("ip", "port")
 
-# list of params that should be treated as set during diff
-SET_PARAMS = [
+# params that should be treated as set during diff
+SET_PARAMS = frozenset([
     "other_ips",
     "other_ports",
     "networks",
-]
+])
 
-# list of params that should be removed before calls to API
-SANITIZED_PARAMS = [
+# params that should be removed before calls to API
+SANITIZED_PARAMS = frozenset([
     "state",
     "name",
+])
+
+MODULE_ARG_SPEC = {
+    "name": {"required": True, "type": "str"},
+    "refresh": {"required": False, "type": "int", "default": None},
+    "retry": {"required": False, "type": "int", "default": None},
+    "expiry": {"required": False, "type": "int", "default": None},
+    "nx_ttl": {"required": False, "type": "int", "default": None},
+    "ttl": {"required": False, "type": "int", "default": None},
+    "link": {"required": False, "type": "str", "default": None},
+    "networks": {"required": False, "type": "list", "default": None},
+    "secondary": {
+        "required": False,
+        "type": "dict",
+        "default": None,
+        "options": {
+            "enabled": {"type": "bool", "default": False},
+            "primary_ip": {"required": False, "type": "str", "default": None},
+            "primary_port": {
+                "required": False, "type": "int", "default": None
+            },
+            "other_ips": {"required": False, "type": "list", "default": None},
+            "other_ports": {
+                "required": False, "type": "list", "default": None
+            },
+            "tsig": {
+                "required": False,
+                "type": "dict",
+                "default": None,
+                "options": {
+                    "enabled": {"type": "bool", "default": None},
+                    "hash": {"type": "str", "default": None},
+                    "key": {"type": "str", "default": None},
+                    "name": {"type": "str", "default": None},
+                },
+            },
+        },
+    },
+    "primary": {
+        "required": False,
+        "type": "dict",
+        "default": None,
+        "options": {
+            "enabled": {"type": "bool", "default": None},
+            "secondaries": {
+                "type": "list",
+                "default": None,
+                "options": {
+                    "ip": {"type": "str", "default": None},
+                    "port": {"required": False, "type": "int", "default": None},
+                    "notify": {
+                        "required": False, "type": "bool", "default": None
+                    },
+                },
+            },
+        },
+    },
+    "dnssec": {"required": False, "type": "bool", "default": None},
+    "state": {
+        "required": False,
+        "type": "str",
+        "default": "present",
+        "choices": ["present", "absent"],
+    },
+}
+
+MUTUALLY_EXCLUSIVE = [
+    ["link", "networks"],
+    ["link", "retry"],
+    ["link", "expiry"],
+    ["link", "nx_ttl"],
+    ["link", "ttl"],
+    ["link", "secondary"],
+    ["link", "primary"],
+    ["link", "refresh"],
 ]
 
 
+def _filter_empty_params(d):
+    """Recursively drops params with no value, and nested dicts whose
+    params all have no value.
+
+    :param d: Ansible module parameters
+    :type d: dict
+    :return: Params that carry a value
+    :rtype: dict
+    """
+    filtered = {}
+    for key, val in d.items():
+        if isinstance(val, dict):
+            nested = _filter_empty_params(val)
+            if nested:
+                filtered[key] = nested
+        elif val is not None:
+            filtered[key] = val
+    return filtered
+
+
 class NS1Zone(NS1ModuleBase):
     """Represents the NS1 Zone module implementation
     """
@@ -277,87 +392,11 @@ class NS1Zone(NS1ModuleBase):
     def __init__(self):
         """Constructor method
         """
-        self.module_arg_spec = dict(
-            name=dict(required=True, type="str"),
-            refresh=dict(required=False, type="int", default=None),
-            retry=dict(required=False, type="int", default=None),
-            expiry=dict(required=False, type="int", default=None),
-            nx_ttl=dict(required=False, type="int", default=None),
-            ttl=dict(required=False, type="int", default=None),
-            link=dict(required=False, type="str", default=None),
-            networks=dict(required=False, type="list", default=None),
-            secondary=dict(
-                required=False,
-                type="dict",
-                default=None,
-                options=dict(
-                    enabled=dict(type="bool", default=False),
-                    primary_ip=dict(required=False, type="str", default=None),
-                    primary_port=dict(
-                        required=False, type="int", default=None
-                    ),
-                    other_ips=dict(required=False, type="list", default=None),
-                    other_ports=dict(
-                        required=False, type="list", default=None
-                    ),
-                    tsig=dict(
-                        required=False,
-                        type="dict",
-                        default=None,
-                        options=dict(
-                            enabled=dict(type="bool", default=None),
-                            hash=dict(type="str", default=None),
-                            key=dict(type="str", default=None),
-                            name=dict(type="str", default=None),
-                        ),
-                    ),
-                ),
-            ),
-            primary=dict(
-                required=False,
-                type="dict",
-                default=None,
-                options=dict(
-                    enabled=dict(type="bool", default=None),
-                    secondaries=dict(
-                        type="list",
-                        default=None,
-                        options=dict(
-                            ip=dict(type="str", default=None),
-                            port=dict(
-                                required=False, type="int", default=None
-                            ),
-                            notify=dict(
-                                required=False, type="bool", default=None
-                            ),
-                        ),
-                    ),
-                ),
-            ),
-            dnssec=dict(required=False, type="bool", default=None),
-            state=dict(
-                required=False,
-                type="str",
-                default="present",
-                choices=["present", "absent"],
-            ),
-        )
-        self.mutually_exclusive = [
-            ["link", "networks"],
-            ["link", "retry"],
-            ["link", "expiry"],
-            ["link", "nx_ttl"],
-            ["link", "ttl"],
-            ["link", "secondary"],
-            ["link", "primary"],
-            ["link", "refresh"],
-        ]
-
         NS1ModuleBase.__init__(
             self,
-            self.module_arg_spec,
+            MODULE_ARG_SPEC,
             supports_check_mode=True,
-            mutually_exclusive=self.mutually_exclusive,
+            mutually_exclusive=MUTUALLY_EXCLUSIVE,
         )
 
     def sanitize_params(self, params):
@@ -369,23 +408,13 @@ class NS1Zone(NS1ModuleBase):
         :return: Sanitized dict of params
         :rtype: dict
         """
-
-        def filter_empty_params(d):
-            filtered = {}
-            for key, val in d.items():
-                if isinstance(val, dict):
-                    nested = filter_empty_params(val)
-                    if nested:
-                        filtered[key] = nested
-                elif val is not None:
-                    filtered[key] = val
-            return filtered
-
-        params = filter_empty_params(params)
-        # remove sanitized params from top level
-        for param in SANITIZED_PARAMS:
-            params.pop(param, None)
-        return params
+        params = _filter_empty_params(params)
+        # drop sanitized params from top level
+        return {
+            key: val
+            for key, val in params.items()
+            if key not in SANITIZED_PARAMS
+        }
 
     def get_zone(self, name):
         """Retrieves a zone from NS1. If no name is given or zone does not
@@ -421,6 +450,9 @@ class NS1Zone(NS1ModuleBase):
         :rtype: dict
         """
         diff = {}
+        if have == want:
+            # idempotent re-runs are the common case; skip the walk
+            return diff
         for param, wanted_val in want.items():
             if param not in have:
                 diff[param] = wanted_val
@@ -430,7 +462,7 @@ class NS1Zone(NS1ModuleBase):
                 if subparam_diff:
                     diff[param] = subparam_diff
             elif isinstance(wanted_val, list) and param in SET_PARAMS:
-                if set(have[param]) != set(wanted_val):
+                if set(have[param]).symmetric_difference(wanted_val):
                     diff[param] = wanted_val
             elif have[param] != wanted_val:
                 diff[param] = wanted_val
@@ -480,12 +512,20 @@ class NS1Zone(NS1ModuleBase):
         elif len(want_secondaries) != len(have_secondaries):
             return True
 
+        # index existing secondaries once and compare wanted ones against
+        # it directly, bailing out on the first difference
         have = self.convert_secondaries_to_dict(have_secondaries)
-        want = self.convert_secondaries_to_dict(want_secondaries)
-        diff = self.diff_params(have, want)
-        if diff:
-            return True
-
+        try:
+            for want_secondary in want_secondaries:
+                have_secondary = have.get(_secondary_key(want_secondary))
+                if have_secondary is None:
+                    return True
+                if self.diff_params(have_secondary, want_secondary):
+                    return True
+        except KeyError as ke:
+            self.module.fail_json(
+                msg="missing field in secondary definition: {0}".format(ke)
+            )
         return False
 
     def convert_secondaries_to_dict(self, secondaries):
@@ -498,7 +538,7 @@ class NS1Zone(NS1ModuleBase):
         :rtype: dict
         """
         try:
-            return {(s["ip"], s["port"]): s for s in secondaries}
+            return {_secondary_key(s): s for s in secondaries}
         except KeyError as ke:
             self.module.fail_json(
                 msg="missing field in secondary definition: {0}".format(ke)
@@ -548,14 +588,14 @@ class NS1Zone(NS1ModuleBase):
         :return: Results of module execution
         :rtype: dict
         """
-        changed = False
         state = self.module.params.get("state")
         zone = self.get_zone(self.module.params.get("name"))
-        if state == "present":
-            changed, zone = self.present(zone)
         if state == "absent":
-            changed = self.absent(zone)
-            zone = {}
+            if zone is None:
+                # nothing to delete and nothing to report beyond changed
+                return {"changed": False}
+            return self.build_result(self.absent(zone), {})
+        changed, zone = self.present(zone)
         return self.build_result(changed, zone)
 
     def present(self, zone):
@@ -618,8 +658,9 @@ class NS1Zone(NS1ModuleBase):
         """
         result = {"changed": changed}
         if zone and not self.module.check_mode:
-            result["id"] = zone["id"]
-            result["zone"] = zone.data
+            data = zone.data
+            result["id"] = data["id"]
+            result["zone"] = data
         return result
 
 
@@ -31,8 +31,23 @@ NS1_COMMON_ARGS = dict(
     apiKey=dict(required=True, no_log=True),
     endpoint=dict(required=False, type="str", default=None),
     ignore_ssl=dict(required=False, type="bool", default=None),
+    rate_limit_strategy=dict(
+        required=False,
+        type="str",
+        default=None,
+        choices=["solo", "concurrent"],
+    ),
+    parallelism=dict(required=False, type="int", default=None),
 )
 
+# NS1 clients shared across module instantiations within one Python
+# process, keyed by the connection params. Ansible normally forks a fresh
+# process per task, but when modules run in a persistent interpreter
+# (tests, action plugins, mitogen-style strategies) this lets repeated
+# invocations reuse the same client and its underlying HTTP session
+# instead of paying connection setup on every call.
+_CLIENT_CACHE = {}
+
 
 class NS1ModuleBase(object):
     def __init__(
@@ -40,16 +55,27 @@ class NS1ModuleBase(object):
         derived_arg_spec,
         supports_check_mode=False,
         mutually_exclusive=None,
+        required_if=None,
     ):
         merged_arg_spec = dict()
         merged_arg_spec.update(NS1_COMMON_ARGS)
         if derived_arg_spec:
             merged_arg_spec.update(derived_arg_spec)
 
+        # concurrent rate limiting needs a worker count; validate the
+        # pair here so modules fail cleanly instead of surfacing the
+        # SDK's ConfigException on the first API call
+        merged_required_if = [
+            ["rate_limit_strategy", "concurrent", ["parallelism"]],
+        ]
+        if required_if:
+            merged_required_if.extend(required_if)
+
         self.module = AnsibleModule(
             argument_spec=merged_arg_spec,
             supports_check_mode=supports_check_mode,
             mutually_exclusive=mutually_exclusive,
+            required_if=merged_required_if,
         )
 
         if not HAS_NS1:
@@ -58,20 +84,48 @@ class NS1ModuleBase(object):
         self._strip_common_params()
 
     def errback_generator(self):
-        def errback(args):
-            self.module.fail_json(msg="%s - %s" % (args[0], args[1]))
+        # the closure is stateless apart from self, so build it once and
+        # hand the same function to every API call
+        errback = getattr(self, "_errback", None)
+        if errback is None:
 
+            def errback(args):
+                self.module.fail_json(msg="%s - %s" % (args[0], args[1]))
+
+            self._errback = errback
         return errback
 
     def _build_ns1(self):
+        cache_key = (
+            self.module.params["apiKey"],
+            self.module.params["endpoint"],
+            self.module.params["ignore_ssl"],
+            self.module.params["rate_limit_strategy"],
+            self.module.params["parallelism"],
+        )
+        cached = _CLIENT_CACHE.get(cache_key)
+        if cached is not None:
+            self.ns1 = cached
+            self.config = cached.config
+            return
         self.config = Config()
         self.config.createFromAPIKey(self.module.params["apiKey"])
-        self.config["transport"] = "basic"
+        # let the SDK pick its default transport: the requests-based one
+        # keeps a pooled Session (TCP/TLS reuse across the calls a module
+        # makes), falling back to the basic urllib transport only when
+        # requests is not installed
         if self.module.params["endpoint"]:
             self.config["endpoint"] = self.module.params["endpoint"]
         if self.module.params["ignore_ssl"]:
             self.config["ignore-ssl-errors"] = self.module.params["ignore_ssl"]
+        if self.module.params["rate_limit_strategy"]:
+            self.config["rate_limit_strategy"] = self.module.params[
+                "rate_limit_strategy"
+            ]
+        if self.module.params["parallelism"]:
+            self.config["parallelism"] = self.module.params["parallelism"]
         self.ns1 = NS1(config=self.config)
+        _CLIENT_CACHE[cache_key] = self.ns1
 
     def _strip_common_params(self):
         """Remove the params we've handled, so the rest of the module doesn't
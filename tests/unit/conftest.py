@@ -3,10 +3,7 @@ from ns1 import Config
 from ansible.module_utils import basic
 from .common import FakeAnsibleModule
 
-try:  # Python 3.3 +
-    from unittest.mock import patch
-except ImportError:
-    from mock import patch
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -21,9 +18,10 @@ def zones_update_helper(request):
     request.addfinalizer(zones_update_helper.stop)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ns1_config():
-    """Returns a mock NS1 SDK config object
+    """Returns a mock NS1 SDK config object, shared across the test
+    session since tests only read from it
 
     :return: Mock NS1 SDK config object
     :rtype: Config
@@ -45,6 +43,18 @@ def ns1_config():
     return c
 
 
+@pytest.fixture(scope="session")
+def fake_module():
+    """Returns a FakeAnsibleModule helper bound to the shared test zone
+    name; the helper is stateless beyond the name, so one instance
+    serves the whole session
+
+    :return: Fake Ansible module helper
+    :rtype: FakeAnsibleModule
+    """
+    return FakeAnsibleModule("test.zone")
+
+
 @pytest.fixture()
 def mock_module_helper(request):
     """Patches Ansible module exit_json, fail_json and get_bin_path methods
@@ -5,10 +5,7 @@ from collections import namedtuple
 from .common import FakeAnsibleModule, AnsibleFailJson
 from library import ns1_datasource_info
 
-try:  # Python 3.3 +
-    from unittest.mock import patch
-except ImportError:
-    from mock import patch
+from unittest.mock import patch
 
 try:
     from ns1.rest.errors import ResourceException
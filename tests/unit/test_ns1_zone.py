@@ -4,10 +4,20 @@ import ns1.zones
 from .common import FakeAnsibleModule, AnsibleFailJson
 from library import ns1_zone
 
-try:  # Python 3.3 +
-    from unittest.mock import patch, Mock
-except ImportError:
-    from mock import patch, Mock
+from unittest.mock import patch, Mock
+
+
+@pytest.fixture(scope="module")
+def zone():
+    """Returns an NS1Zone instance shared by the pure-function tests
+
+    :return: NS1Zone module instance
+    :rtype: NS1Zone
+    """
+    FakeAnsibleModule.set_module_args(
+        {"apiKey": "testkey", "name": "test.zone"}
+    )
+    return ns1_zone.NS1Zone()
 
 
 @pytest.mark.usefixtures("mock_module_helper")
@@ -78,15 +88,17 @@ def test_module_fail_when_required_args_missing():
             {},
             id="no_diff_dict_param",
         ),
+        pytest.param(
+            {"nx_ttl": 0, "networks": [1, 2, 3]},
+            {"nx_ttl": 0, "networks": [1, 2, 3]},
+            {},
+            id="identical_params",
+        ),
     ],
 )
 @pytest.mark.usefixtures("mock_module_helper")
-def test_diff_params(have, want, exp):
-    FakeAnsibleModule.set_module_args(
-        {"apiKey": "testkey", "name": "test.zone"}
-    )
-    z = ns1_zone.NS1Zone()
-    assert z.diff_params(have, want) == exp
+def test_diff_params(zone, have, want, exp):
+    assert zone.diff_params(have, want) == exp
 
 
 @patch("library.ns1_zone.NS1Zone.diff_params")
@@ -174,32 +186,17 @@ def test_get_changed_params(mock_diff_in_secondaries, mock_diff_params):
         ),
     ],
 )
-def test_diff_in_secondaries(have, want, exp):
-    z = ns1_zone.NS1Zone()
-    assert z.diff_in_secondaries(have, want) == exp
+def test_diff_in_secondaries(zone, have, want, exp):
+    assert zone.diff_in_secondaries(have, want) == exp
 
 
-def test_convert_secondaries_to_dict():
-    z = ns1_zone.NS1Zone()
+def test_convert_secondaries_to_dict(zone):
     secondaries = [
         {"ip": "1.1.1.1", "port": 1, "networks": [0], "notify": True},
         {"ip": "2.2.2.2", "port": 2, "networks": [0], "notify": True},
     ]
-    exp = {
-        ("1.1.1.1", 1): {
-            "ip": "1.1.1.1",
-            "port": 1,
-            "networks": [0],
-            "notify": True,
-        },
-        ("2.2.2.2", 2): {
-            "ip": "2.2.2.2",
-            "port": 2,
-            "networks": [0],
-            "notify": True,
-        },
-    }
-    assert z.convert_secondaries_to_dict(secondaries) == exp
+    exp = {(s["ip"], s["port"]): s for s in secondaries}
+    assert zone.convert_secondaries_to_dict(secondaries) == exp
 
 
 @pytest.mark.parametrize(
@@ -218,8 +215,8 @@ def test_convert_secondaries_to_dict():
 )
 @pytest.mark.usefixtures("mock_module_helper")
 @patch("ns1.zones.Zone.update")
-def test_update(mock_zone_update, ns1_config, zone_data, args):
-    m = FakeAnsibleModule("test.zone")
+def test_update(mock_zone_update, ns1_config, fake_module, zone_data, args):
+    m = fake_module
 
     mock_zone = ns1.zones.Zone(ns1_config, m.name)
     mock_zone.data = m.get_zone_data(**zone_data)
@@ -233,8 +230,8 @@ def test_update(mock_zone_update, ns1_config, zone_data, args):
 @pytest.mark.parametrize("check_mode", [True, False])
 @pytest.mark.usefixtures("mock_module_helper")
 @patch("ns1.zones.Zone.update")
-def test_check_mode(mock_zone_update, ns1_config, check_mode):
-    m = FakeAnsibleModule("test.zone")
+def test_check_mode(mock_zone_update, ns1_config, fake_module, check_mode):
+    m = fake_module
 
     mock_zone = ns1.zones.Zone(ns1_config, m.name)
     mock_zone.data = m.get_zone_data(nx_ttl=0)
@@ -295,17 +292,16 @@ def test_check_mode(mock_zone_update, ns1_config, check_mode):
         ),
     ],
 )
-def test_sanitize_params(module_args, exp_params):
-    z = ns1_zone.NS1Zone()
-    params = z.sanitize_params(module_args)
+def test_sanitize_params(zone, module_args, exp_params):
+    params = zone.sanitize_params(module_args)
     assert params == exp_params
 
 
 @pytest.mark.usefixtures("mock_module_helper")
 @patch("ns1.zones.Zone.load")
-def test_get_zone(mock_zone_load, ns1_config):
-    zone_name = "test.zone"
-    m = FakeAnsibleModule(zone_name)
+def test_get_zone(mock_zone_load, ns1_config, fake_module):
+    zone_name = fake_module.name
+    m = fake_module
 
     mock_zone = ns1.zones.Zone(ns1_config, m.name)
     mock_zone.data = m.get_zone_data()
@@ -319,8 +315,8 @@ def test_get_zone(mock_zone_load, ns1_config):
 
 
 @patch("ns1.zones.Zone.delete")
-def test_delete(mock_zone_delete, ns1_config):
-    m = FakeAnsibleModule("test.zone")
+def test_delete(mock_zone_delete, ns1_config, fake_module):
+    m = fake_module
 
     mock_zone = ns1.zones.Zone(ns1_config, m.name)
     mock_zone.data = m.get_zone_data()
@@ -332,9 +328,9 @@ def test_delete(mock_zone_delete, ns1_config):
 
 
 @patch("ns1.NS1.createZone")
-def test_create(mock_zone_create, ns1_config):
+def test_create(mock_zone_create, ns1_config, fake_module):
     args = {"nx_ttl": 1}
-    m = FakeAnsibleModule("test.zone")
+    m = fake_module
     m.set_module_args(m.get_args(**args))
 
     z = ns1_zone.NS1Zone()
@@ -431,8 +427,10 @@ def test_absent(mock_delete, mock_zone, exp_changed):
         ),
     ],
 )
-def test_build_result(zone_data, changed, check_mode, exp_result, ns1_config):
-    m = FakeAnsibleModule("test.zone")
+def test_build_result(
+    zone_data, changed, check_mode, exp_result, ns1_config, fake_module
+):
+    m = fake_module
     mock_zone = None
     if zone_data:
         mock_zone = ns1.zones.Zone(ns1_config, m.name)